@@ -6,26 +6,68 @@ This script executes liquidctl commands to gather sensor data from liquid coolin
 and publishes the data to an MQTT broker with a structured topic hierarchy.
 """
 
+import argparse
+import atexit
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import json
+import queue
+import signal
+import socket
 import sys
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import threading
 import time
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 import paho.mqtt.client as mqtt
-from paho.mqtt.enums import CallbackAPIVersion
+try:
+    from paho.mqtt.enums import CallbackAPIVersion
+except ImportError: # paho-mqtt < 2.0 has no callback API versioning
+    CallbackAPIVersion = None
 import os
 
+# NVML (pynvml) is optional; GPU metrics fall back to the nvidia-smi
+# subprocess when it is not installed or fails to initialize
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
 
-# Configure logging
+# orjson is optional: it parses/serializes several times faster than the
+# stdlib encoder and emits bytes directly, which paho accepts as payload
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
+
+# Configure logging. Records are handed to a queue and written out by a
+# background listener thread, so the poll/publish path never blocks on a
+# disk or stdout write, which matters on slow media like SD cards.
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/var/log/liquidctl2mqtt.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('/var/log/liquidctl2mqtt.log'),
+    logging.StreamHandler(sys.stdout),
+    respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
@@ -42,26 +84,28 @@ def run_liquidctl_command():
         dict: Parsed JSON data from liquidctl or None if error
     """
     try:
-        # Run liquidctl status command with JSON output
+        # Run liquidctl status command with JSON output. stdout stays raw
+        # bytes: the JSON parser accepts them directly, skipping a full
+        # Python-level UTF-8 decode of the buffer
         result = subprocess.run(
             ['liquidctl', 'status', '--json'],
             capture_output=True,
-            text=True,
             timeout=30,
             check=True
         )
         
         logger.info("Successfully executed liquidctl command")
-        return json.loads(result.stdout)
+        return _json_loads(result.stdout)
         
     except subprocess.CalledProcessError as e:
         logger.error(f"liquidctl command failed with return code {e.returncode}")
-        logger.error(f"Error output: {e.stderr}")
+        logger.error(f"Error output: {e.stderr.decode('utf-8', 'replace')}")
         return None
     except subprocess.TimeoutExpired:
         logger.error("liquidctl command timed out")
         return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
         logger.error(f"Failed to parse liquidctl JSON output: {e}")
         return None
     except FileNotFoundError:
@@ -72,50 +116,223 @@ def run_liquidctl_command():
         return None
 
 
+# Cached NVML device handles; None = not yet probed, False = NVML unusable
+_nvml_handles = None
+
+# NVML refreshes power readings only every ~20-100 ms depending on the GPU
+# generation; sampling faster just returns the previous value. Readings are
+# cached for this window and reused instead of re-querying NVML.
+GPU_MIN_SAMPLE_INTERVAL = 0.1
+
+# Last NVML sample and its monotonic timestamp, reused within the window
+_gpu_sample_cache = {'time': 0.0, 'metrics': None}
+
+
+def _init_nvml_handles():
+    """
+    Initialize NVML once and cache the per-device handles.
+
+    Returns:
+        list or None: Device handles, or None if NVML is unavailable
+    """
+    global _nvml_handles
+    if _nvml_handles is None:
+        if pynvml is None:
+            logger.info("pynvml not installed, using nvidia-smi for GPU metrics")
+            _nvml_handles = False
+        else:
+            try:
+                pynvml.nvmlInit()
+                atexit.register(pynvml.nvmlShutdown)
+                _nvml_handles = [pynvml.nvmlDeviceGetHandleByIndex(i)
+                                 for i in range(pynvml.nvmlDeviceGetCount())]
+                logger.info(f"NVML initialized, found {len(_nvml_handles)} GPU(s)")
+            except pynvml.NVMLError as e:
+                logger.warning(f"NVML initialization failed: {e}, using nvidia-smi for GPU metrics")
+                _nvml_handles = False
+    return _nvml_handles if _nvml_handles is not False else None
+
+
+_NVIDIA_SMI_QUERY_ARGS = ['--query-gpu=name,temperature.gpu,power.draw', '--format=csv,noheader,nounits']
+
+# Matches one CSV row like "NVIDIA GeForce RTX 3090, 45, 120.50"
+# (name, temperature, power); malformed rows simply do not match. Compiled
+# over bytes so raw subprocess output is parsed without decoding first.
+_SMI_ROW_RE = re.compile(rb'^\s*(.+?)\s*,\s*(\d+)\s*,\s*([\d.]+)\s*$', re.M)
+
+
+def _parse_nvidia_smi_csv(data):
+    """
+    Parse raw nvidia-smi CSV output into the get_gpu_metrics dict format.
+
+    One regex pass over the whole buffer instead of per-line split/strip;
+    malformed rows are skipped by the pattern itself. int() and float()
+    accept the matched bytes directly, so only the GPU name is decoded.
+
+    Args:
+        data (bytes): Raw CSV output from nvidia-smi
+
+    Returns:
+        list: One dict per parseable row with 'name', 'temperature', 'power'
+    """
+    return [
+        {'name': name.decode('utf-8', 'replace'), 'temperature': int(temp_str), 'power': float(power_str)}
+        for name, temp_str, power_str in _SMI_ROW_RE.findall(data)
+    ]
+
+
+class _NvidiaSmiStream:
+    """
+    Persistent nvidia-smi process streaming CSV rows via -lms.
+
+    Launching nvidia-smi costs a few hundred milliseconds per fork; with
+    -lms a single process keeps emitting one row per GPU per interval, and a
+    reader thread retains the newest row set for snapshot() to hand out.
+    """
+
+    def __init__(self, gpu_count, interval_ms=1000):
+        self.gpu_count = gpu_count
+        self._latest = []
+        self._lock = threading.Lock()
+        self.proc = subprocess.Popen(
+            ['nvidia-smi', '-lms', str(interval_ms)] + _NVIDIA_SMI_QUERY_ARGS,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        atexit.register(self.close)
+        self._thread = threading.Thread(target=self._reader, daemon=True)
+        self._thread.start()
+
+    def _reader(self):
+        # Accumulate a complete batch (one row per GPU) before swapping it
+        # in: publishing a window that straddles two sample batches would
+        # rotate readings onto the wrong GPU index downstream
+        batch = []
+        for line in self.proc.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            batch.append(line)
+            if len(batch) == self.gpu_count:
+                with self._lock:
+                    self._latest = batch
+                batch = []
+
+    def snapshot(self):
+        """Return the newest complete row batch (empty while warming up)."""
+        with self._lock:
+            return self._latest
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def close(self):
+        try:
+            self.proc.terminate()
+            self.proc.wait(timeout=5)
+        except Exception:
+            pass
+
+
+# Persistent nvidia-smi stream; None = not started, False = streaming unusable
+_smi_stream = None
+
+# Monotonic deadline until which GPU polling is skipped entirely: hosts
+# without nvidia-smi should not pay a failing fork on every cycle
+_gpu_unavailable_until = 0.0
+GPU_UNAVAILABLE_RETRY_SECONDS = 3600
+
+
+def _get_gpu_metrics_nvml(handles):
+    """
+    Query GPU name, temperature and power via NVML using cached handles.
+
+    Args:
+        handles (list): NVML device handles from _init_nvml_handles
+
+    Returns:
+        list: Same shape as get_gpu_metrics — one dict per GPU
+    """
+    gpu_metrics = []
+    for handle in handles:
+        name = pynvml.nvmlDeviceGetName(handle)
+        if isinstance(name, bytes):
+            name = name.decode('utf-8', 'replace')
+        temperature = int(pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU))
+        power = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0
+        gpu_metrics.append({'name': name, 'temperature': temperature, 'power': power})
+    return gpu_metrics
+
+
 def get_gpu_metrics():
     """
-    Executes nvidia-smi command, parses output for GPU name, temperatures, and power, and returns them.
+    Collect GPU name, temperature and power for every NVIDIA GPU.
+
+    Prefers in-process NVML queries (no fork/exec per sample); falls back to
+    parsing nvidia-smi output when pynvml is unavailable.
 
     Returns:
         list: A list of dictionaries, each containing 'name' (str), 'temperature' (int) and 'power' (float) for a GPU.
 
     Raises:
-        NvidiaSmiError: If nvidia-smi command fails or returns unexpected output.
+        NvidiaSmiError: If the nvidia-smi fallback fails or returns unexpected output.
     """
+    global _smi_stream, _gpu_unavailable_until
+
+    # Host previously had no nvidia-smi: short-circuit instead of re-forking
+    # a process that is going to fail, and re-probe only after a long TTL
+    if time.monotonic() < _gpu_unavailable_until:
+        return []
+
+    handles = _init_nvml_handles()
+    if handles is not None:
+        now = time.monotonic()
+        if (_gpu_sample_cache['metrics'] is not None
+                and now - _gpu_sample_cache['time'] < GPU_MIN_SAMPLE_INTERVAL):
+            return _gpu_sample_cache['metrics']
+        try:
+            metrics = _get_gpu_metrics_nvml(handles)
+            _gpu_sample_cache['time'] = now
+            _gpu_sample_cache['metrics'] = metrics
+            return metrics
+        except pynvml.NVMLError as e:
+            logger.warning(f"NVML query failed: {e}, falling back to nvidia-smi")
+
+    # Reuse the persistent nvidia-smi stream once it is running and warm
+    if _smi_stream not in (None, False) and _smi_stream.alive():
+        lines = _smi_stream.snapshot()
+        if len(lines) == _smi_stream.gpu_count:
+            return _parse_nvidia_smi_csv(b'\n'.join(lines))
+
     try:
-        command = ['nvidia-smi', '--query-gpu=name,temperature.gpu,power.draw', '--format=csv,noheader,nounits']
         result = subprocess.run(
-            command,
+            ['nvidia-smi'] + _NVIDIA_SMI_QUERY_ARGS,
             capture_output=True,
-            text=True,
             timeout=15,
             check=True
         )
 
-        gpu_metrics = []
-        for line in result.stdout.strip().split('\n'):
-            line = line.strip()
-            if line:
-                try:
-                    # Example: "NVIDIA GeForce RTX 3090, 45, 120.50" (name, temperature, power)
-                    parts = [p.strip() for p in line.split(',')]
-                    if len(parts) == 3:
-                        name, temp_str, power_str = parts
-                        temperature = int(temp_str)
-                        power = float(power_str)
-                        gpu_metrics.append({'name': name, 'temperature': temperature, 'power': power})
-                    else:
-                        logger.warning(f"Could not parse GPU metrics from line (expected 3 parts): '{line}'")
-                except ValueError as ve:
-                    logger.warning(f"Could not parse GPU metrics from line '{line}': {ve}")
+        gpu_metrics = _parse_nvidia_smi_csv(result.stdout)
+
+        # First successful one-shot told us the GPU count; start the stream
+        # so subsequent polls read from it instead of re-forking nvidia-smi
+        if gpu_metrics and _smi_stream is None:
+            try:
+                _smi_stream = _NvidiaSmiStream(len(gpu_metrics))
+                logger.info("Started persistent nvidia-smi stream for GPU metrics")
+            except Exception as e:
+                logger.warning(f"Could not start persistent nvidia-smi stream: {e}")
+                _smi_stream = False
+
         return gpu_metrics
     except FileNotFoundError:
-        logger.warning("Command 'nvidia-smi' not found. Assuming no NVIDIA GPUs or drivers.")
+        _gpu_unavailable_until = time.monotonic() + GPU_UNAVAILABLE_RETRY_SECONDS
+        logger.warning("Command 'nvidia-smi' not found. Assuming no NVIDIA GPUs or drivers; retrying in %d s.", GPU_UNAVAILABLE_RETRY_SECONDS)
         return []
     except subprocess.CalledProcessError as e:
         raise NvidiaSmiError(
             f"nvidia-smi command failed with exit code {e.returncode}. "
-            f"Error: {e.stderr.strip()}"
+            f"Error: {e.stderr.decode('utf-8', 'replace').strip()}"
         ) from e
     except subprocess.TimeoutExpired:
         raise NvidiaSmiError("nvidia-smi command timed out.")
@@ -123,29 +340,52 @@ def get_gpu_metrics():
         raise NvidiaSmiError(f"An unexpected error occurred while getting GPU metrics: {e}") from e
 
 
-def get_device_name():
+def get_device_name(config=None):
     """
     Extract device name from liquidctl output or use default.
-    
+
+    Args:
+        config (dict, optional): Already-loaded configuration. Loaded from
+            disk only when not provided, so callers that hold the config
+            avoid a redundant load.
+
     Returns:
         str: Device name for MQTT topics
     """
-    # Load configuration
-    config = load_config()
-    
+    if config is None:
+        config = load_config()
+
     # Try to determine device name from environment, config, or system
     device_name = os.environ.get('LIQUIDCTL_DEVICE_NAME', config['liquidctl']['device_name'])
-    
+
     return device_name
 
 
+# Parsed configuration cached against config.json's mtime: unchanged files
+# are never re-read, while edits are picked up on the next call
+_config_cache = {'mtime': None, 'config': None}
+
+
 def load_config():
     """
-    Load configuration from config.json file or use defaults
-    
+    Load configuration from config.json file or use defaults.
+
+    The parsed config is cached keyed on the file's mtime, so repeat calls
+    cost one stat() until config.json actually changes (or appears).
+    Callers must not mutate the returned dict.
+
     Returns:
         dict: Configuration dictionary
     """
+    config_path = os.path.join(os.path.dirname(__file__), 'config.json')
+    try:
+        mtime = os.stat(config_path).st_mtime
+    except OSError:
+        mtime = None # No config file present
+
+    if _config_cache['config'] is not None and _config_cache['mtime'] == mtime:
+        return _config_cache['config']
+
     config = {
         'mqtt': {
             'host': 'localhost',
@@ -153,19 +393,21 @@ def load_config():
             'username': '',
             'password': '',
             'mqtt_topic_base': 'home/liquidctl', # Default topic base for liquidctl
-            'nvidia_gpu_topic_base': 'home/nvidia_gpu' # Default topic base for NVIDIA GPU
+            'nvidia_gpu_topic_base': 'home/nvidia_gpu', # Default topic base for NVIDIA GPU
+            'qos': 0, # QoS 0 is fire-and-forget; telemetry readings are superseded seconds later
+            'aggregate': False, # Publish one combined payload per device instead of per-sensor topics
+            'retain': True # Retain sensor state so new subscribers get the last value immediately
         },
         'liquidctl': {
             'device_name': 'my_cooling_system',
             'units_enabled': False
         }
     }
-    
+
     try:
-        config_path = os.path.join(os.path.dirname(__file__), 'config.json')
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                file_config = json.load(f)
+        if mtime is not None:
+            with open(config_path, 'rb') as f:
+                file_config = _json_loads(f.read())
                 # Merge file config with defaults
                 config.update(file_config)
                 logger.info(f"Loaded configuration from {config_path}")
@@ -173,11 +415,136 @@ def load_config():
             logger.info("No config.json found, using defaults and environment variables")
     except Exception as e:
         logger.warning(f"Failed to load config.json: {e}, using defaults")
-    
+
+    _config_cache['mtime'] = mtime
+    _config_cache['config'] = config
     return config
 
 
-def publish_to_mqtt(client, data, device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base):
+@dataclass(frozen=True)
+class Settings:
+    """
+    Runtime settings resolved once at startup from config file + environment.
+
+    Freezing these into one immutable object means the poll loop reads plain
+    attributes instead of re-querying os.environ and the config dict on
+    every cycle.
+    """
+    mqtt_host: str
+    mqtt_port: int
+    mqtt_user: Optional[str]
+    mqtt_password: Optional[str]
+    mqtt_topic_base: str
+    nvidia_gpu_topic_base: str
+    qos: int
+    aggregate: bool
+    retain: bool
+    units_enabled: bool
+    device_name: str
+    interval: float
+
+    @classmethod
+    def from_config(cls, config):
+        """Resolve settings from the config dict, letting environment variables override."""
+        def _env_bool(name, default):
+            return os.environ.get(name, str(default)).lower() in ('true', '1', 'yes', 'on')
+
+        return cls(
+            mqtt_host=os.environ.get('MQTT_HOST', config['mqtt']['host']),
+            mqtt_port=int(os.environ.get('MQTT_PORT', config['mqtt']['port'])),
+            mqtt_user=os.environ.get('MQTT_USER', config['mqtt']['username']) or None,
+            mqtt_password=os.environ.get('MQTT_PASSWORD', config['mqtt']['password']) or None,
+            mqtt_topic_base=os.environ.get('MQTT_TOPIC_BASE', config['mqtt']['mqtt_topic_base']),
+            nvidia_gpu_topic_base=os.environ.get('NVIDIA_GPU_TOPIC_BASE', config['mqtt']['nvidia_gpu_topic_base']),
+            qos=int(os.environ.get('MQTT_QOS', config['mqtt'].get('qos', 0))),
+            aggregate=_env_bool('MQTT_AGGREGATE', config['mqtt'].get('aggregate', False)),
+            retain=_env_bool('MQTT_RETAIN', config['mqtt'].get('retain', True)),
+            units_enabled=_env_bool('LIQUIDCTL_UNITS_ENABLED', config['liquidctl']['units_enabled']),
+            device_name=get_device_name(config),
+            interval=float(os.environ.get('LIQUIDCTL_INTERVAL', config['liquidctl'].get('interval', 30)))
+        )
+
+
+# Bounded hand-off queue drained by the background publisher thread; stays
+# None when the thread is not running, in which case publishes go inline
+_publish_queue = None
+
+
+def _publish(client, topic, payload, qos=0, retain=False):
+    """
+    Publish a message, through the background queue when one is running.
+
+    Returns the MQTTMessageInfo when publishing inline, True when the
+    message was handed to the publisher thread, or None when the queue was
+    full even after dropping the oldest pending message.
+    """
+    q = _publish_queue
+    if q is None:
+        return _route_client(client, topic).publish(topic, payload, qos=qos, retain=retain)
+    item = (topic, payload, qos, retain)
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        # Drop the oldest pending message rather than block the poll loop:
+        # a fresher reading is on its way and stale telemetry has no value
+        try:
+            q.get_nowait()
+            q.task_done()
+        except queue.Empty:
+            pass
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            logger.warning(f"Publish queue full, dropping message for {topic}")
+            return None
+    return True
+
+
+def _publisher_loop(client):
+    """Drain the publish queue into client.publish until the None sentinel."""
+    # Newest MQTTMessageInfo per underlying client: delivery is in-order on
+    # each socket, so confirming these on shutdown confirms the whole tail
+    last_infos = {}
+    while True:
+        item = _publish_queue.get()
+        try:
+            if item is None:
+                # Make sure the tail of the stream has actually left the
+                # socket(s) before the caller tears the connections down
+                for info in last_infos.values():
+                    try:
+                        info.wait_for_publish(timeout=5)
+                    except (ValueError, RuntimeError) as e:
+                        logger.warning(f"Could not confirm publish of message {info.mid}: {e}")
+                break
+            topic, payload, qos, retain = item
+            try:
+                target = _route_client(client, topic)
+                last_infos[id(target)] = target.publish(topic, payload, qos=qos, retain=retain)
+            except Exception as e:
+                logger.error(f"Background publish to topic {topic} failed: {e}")
+        finally:
+            _publish_queue.task_done()
+
+
+def start_publisher_thread(client):
+    """
+    Start the background publisher thread with a bounded queue.
+
+    Queue depth comes from mqtt.publish_queue_size (default 1000); a value
+    of 0 disables the thread and publishes stay inline with the poll loop.
+    """
+    global _publish_queue
+    maxsize = load_config()['mqtt'].get('publish_queue_size', 1000)
+    if maxsize <= 0:
+        return None
+    _publish_queue = queue.Queue(maxsize=maxsize)
+    thread = threading.Thread(target=_publisher_loop, args=(client,), daemon=True, name='mqtt-publisher')
+    thread.start()
+    return thread
+
+
+def publish_to_mqtt(client, data, device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base, qos=0, aggregate=False, retain=False):
     """
     Publish sensor data to MQTT broker.
     This function expects an already connected MQTT client.
@@ -190,16 +557,113 @@ def publish_to_mqtt(client, data, device_name, timestamp, units_enabled, mqtt_to
         units_enabled (bool): Whether to include units in the payload.
         mqtt_topic_base (str): Base topic for liquidctl data.
         nvidia_gpu_topic_base (str): Base topic for NVIDIA GPU data.
+        qos (int): MQTT QoS level for all sensor publishes.
+        aggregate (bool): Publish one combined payload per device instead of
+            one message per sensor.
+        retain (bool): Ask the broker to retain each message for new
+            subscribers.
+
+    Returns:
+        list: MQTTMessageInfo objects for every queued publish, so callers
+            can wait for delivery instead of sleeping.
     """
+    msg_infos = []
     if isinstance(data, list):
         for device_data in data:
-            publish_device_sensors(client, device_data, device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base)
+            msg_infos.extend(publish_device_sensors(client, device_data, device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base, qos, aggregate, retain))
     else:
-        publish_device_sensors(client, data, device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base)
+        msg_infos.extend(publish_device_sensors(client, data, device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base, qos, aggregate, retain))
     logger.info("Data queued for publishing")
+    return msg_infos
+
+
+# Delta-publish state: last published value per topic, and a cycle counter
+# used to force a periodic full republish so retained state stays fresh
+_last_values = {}
+
+# Device IDs whose static metadata has already gone out this process; the
+# retained .../meta message only needs to be published once per device
+_meta_published = set()
+_poll_count = 0
+KEEPALIVE_POLLS = 60
 
+# Messages actually published by the most recent cycle, after delta
+# suppression; the daemon loop uses it to pace itself when values are idle
+_last_cycle_published = 0
 
-def publish_device_sensors(client, device_data, device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base):
+
+def _should_publish(topic, value, tolerance=0.1):
+    """
+    Decide whether a sensor value changed enough to be worth publishing.
+
+    Numeric values are suppressed while they stay within mqtt.delta_tolerance
+    (default 0.1) of the last published value; other values are suppressed
+    only when exactly equal. The baseline is the last *published* value, so
+    slow drifts still get through once they accumulate past the tolerance.
+
+    This only reads the baseline; the caller records the new value in
+    _last_values once the publish hand-off actually succeeds, so a failed
+    or dropped publish is retried on the next cycle instead of being
+    suppressed as already sent.
+
+    Args:
+        topic (str): Full MQTT topic of the sensor
+        value: Current sensor value
+        tolerance (float): Numeric change below which the value is suppressed
+
+    Returns:
+        bool: True when the value should be published
+    """
+    prev = _last_values.get(topic)
+    if prev is not None:
+        if isinstance(value, (int, float)) and isinstance(prev, (int, float)):
+            if abs(value - prev) <= tolerance:
+                return False
+        elif value == prev:
+            return False
+    return True
+
+
+# One-pass topic sanitization: ASCII upper -> lower, space -> underscore,
+# and the MQTT-reserved '/', '+', '#' -> underscore, all in a single
+# C-level translate instead of chained replace().lower() allocations
+_TOPIC_TABLE = str.maketrans({
+    **{chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)},
+    ' ': '_',
+    '/': '_',
+    '+': '_',
+    '#': '_',
+})
+
+
+def _iter_sensors(device_data, is_gpu_device):
+    """
+    Yield one flat tuple per publishable sensor in a device's status list.
+
+    Centralizes the per-sensor shape checks and key normalization so the
+    aggregate and per-sensor publish paths share one walk over the data.
+
+    Args:
+        device_data (dict): Data for one device
+        is_gpu_device (bool): Whether the entries use the GPU key format
+
+    Yields:
+        tuple: (sensor_type, sensor_name, sensor_value, sensor_unit, sensor_key)
+    """
+    for sensor in device_data.get('status', ()):
+        if isinstance(sensor, dict) and 'key' in sensor and 'value' in sensor:
+            sensor_key = sensor['key']
+            # For liquidctl data, categorize sensor key to get type, then clean name;
+            # for GPU data the key is already the sensor type/name (e.g. 'temperature')
+            if not is_gpu_device:
+                sensor_type = categorize_sensor(sensor_key)
+                sensor_name = sensor_key.translate(_TOPIC_TABLE)
+            else:
+                sensor_type = sensor_name = sensor_key.lower()
+            yield sensor_type, sensor_name, sensor['value'], sensor.get('unit', ''), sensor_key
+
+
+def publish_device_sensors(client, device_data, device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base, qos=0, aggregate=False, retain=False):
     """
     Publish all sensors from a single device
     
@@ -211,7 +675,15 @@ def publish_device_sensors(client, device_data, device_name, timestamp, units_en
         units_enabled (bool): Whether to include units in the payload
         mqtt_topic_base (str): The base topic for liquidctl MQTT messages
         nvidia_gpu_topic_base (str): The base topic for NVIDIA GPU MQTT messages
+        qos (int): MQTT QoS level for sensor publishes
+        aggregate (bool): Collapse all sensors into a single message on the
+            device's .../state topic
+        retain (bool): Ask the broker to retain each message
+
+    Returns:
+        list: MQTTMessageInfo objects returned by client.publish
     """
+    msg_infos = []
     # Determine the topic base to use based on the `device_name` passed to this function.
     # `device_name` here will be either the liquidctl device name or a specific GPU device_id (e.g., 'nvidia_geforce_rtx_3090_gpu_0').
     # We check if the device_name matches the pattern for GPU devices to use the correct topic base.
@@ -222,56 +694,110 @@ def publish_device_sensors(client, device_data, device_name, timestamp, units_en
     if is_gpu_device:
         topic_device_id = device_name
     elif 'device' in device_data:
-        topic_device_id = device_data['device'].replace(' ', '_').lower()
+        topic_device_id = device_data['device'].translate(_TOPIC_TABLE)
     elif 'description' in device_data:
-        topic_device_id = device_data['description'].replace(' ', '_').lower()
+        topic_device_id = device_data['description'].translate(_TOPIC_TABLE)
     else:
-        topic_device_id = device_name.replace(' ', '_').lower() # Fallback
+        topic_device_id = device_name.translate(_TOPIC_TABLE) # Fallback
+
+    # Static metadata (bus, address, description) never changes between
+    # polls; publish it retained on .../meta once per device so late
+    # subscribers still get it, then leave it out of the sensor loop
+    if topic_device_id not in _meta_published:
+        meta = {key: device_data[key] for key in ('device', 'description', 'bus', 'address') if key in device_data}
+        if meta:
+            try:
+                # Same hand-off rule as the sensor baselines: only a
+                # successful hand-off marks the device done, so a failed or
+                # dropped meta publish is retried on the next cycle
+                if _publish(client, f"{current_topic_base}/{topic_device_id}/meta", _json_dumps(meta), qos=qos, retain=True) is not None:
+                    _meta_published.add(topic_device_id)
+            except Exception as e:
+                logger.error(f"Failed to publish device metadata for {topic_device_id}: {e}")
+        else:
+            _meta_published.add(topic_device_id)
 
     # Handle liquidctl status format with 'status' array or GPU data
     if 'status' in device_data and isinstance(device_data['status'], list):
-        for sensor in device_data['status']:
-            if isinstance(sensor, dict) and 'key' in sensor and 'value' in sensor:
-                sensor_key = sensor['key']
-                sensor_value = sensor['value']
-                sensor_unit = sensor.get('unit', '')
-                
-                # For liquidctl data, categorize sensor key to get type, then clean name
-                if not is_gpu_device:
-                    sensor_type = categorize_sensor(sensor_key)
-                    sensor_name = sensor_key.lower().replace(' ', '_')
-                else: # For GPU data, key is already sensor_type/name (e.g., 'temperature', 'power')
-                    sensor_type = sensor_key.lower()
-                    sensor_name = sensor_key.lower()
-
-
-                # Create payload with conditional unit information
-                payload = {
-                    "timestamp": timestamp,
+        # Device-level prefix is invariant across the loop; build it once
+        device_prefix = f"{current_topic_base}/{topic_device_id}"
+
+        if aggregate:
+            # One combined payload on .../state: a single MQTT packet per
+            # device instead of one per sensor
+            sensors = {}
+            for sensor_type, sensor_name, sensor_value, sensor_unit, sensor_key in _iter_sensors(device_data, is_gpu_device):
+                entry = {
                     "sensor_type": sensor_type,
-                    "sensor_name": sensor_name,
                     "value": sensor_value,
-                    "original_key": sensor_key # Keep original key for debugging/reference
+                    "original_key": sensor_key
                 }
-                
-                # Add unit field only if units are enabled
                 if units_enabled and sensor_unit:
-                    payload["unit"] = sensor_unit
-                
-                # Create topic with hierarchical structure
-                # For GPU, this will now be: home/nvidia_gpu/{gpu_device_id}/{sensor_type}
-                # For liquidctl, it remains: home/liquidctl/{aquacomputer_quadro}/{sensor_type}/{sensor_name}
-                if is_gpu_device:
-                    topic = f"{current_topic_base}/{topic_device_id}/{sensor_type}"
-                else:
-                    topic = f"{current_topic_base}/{topic_device_id}/{sensor_type}/{sensor_name}"
-                
-                try:
+                    entry["unit"] = sensor_unit
+                sensors[sensor_name] = entry
+            payload = {"timestamp": timestamp, "sensors": sensors}
+            topic = device_prefix + "/state"
+            try:
+                logger.info(f"Publishing aggregated state to {topic} ({len(sensors)} sensors)")
+                result = _publish(client, topic, _json_dumps(payload), qos=qos, retain=retain)
+                if result is not None:
+                    msg_infos.append(result)
+            except Exception as e:
+                logger.error(f"Failed to publish aggregated state to topic {topic}: {e}")
+            return msg_infos
+
+        mqtt_config = load_config()['mqtt']
+        delta_tolerance = mqtt_config.get('delta_tolerance', 0.1)
+        # Optional per-category QoS overrides, e.g. {"temperature": 0,
+        # "fan_speed": 0}: transient telemetry can ride QoS 0 while
+        # anything not listed keeps the configured default
+        qos_by_category = mqtt_config.get('qos_by_category', {})
+
+        # The timestamp fragment is identical for every sensor this cycle;
+        # encode it once and assemble each payload from pre-encoded pieces
+        # instead of building and serializing a fresh dict per sensor
+        ts_fragment = b'{"timestamp":' + _json_dumps(timestamp)
+
+        for sensor_type, sensor_name, sensor_value, sensor_unit, sensor_key in _iter_sensors(device_data, is_gpu_device):
+            # Byte-assembled payload, field-for-field identical to dumping
+            # {"timestamp", "sensor_type", "sensor_name", "value",
+            #  "original_key"[, "unit"]}; unit only when units are enabled
+            payload = b''.join((
+                ts_fragment,
+                b',"sensor_type":', _json_dumps(sensor_type),
+                b',"sensor_name":', _json_dumps(sensor_name),
+                b',"value":', _json_dumps(sensor_value),
+                b',"original_key":', _json_dumps(sensor_key),
+                b',"unit":' + _json_dumps(sensor_unit) if units_enabled and sensor_unit else b'',
+                b'}'
+            ))
+
+            # Create topic with hierarchical structure
+            # For GPU, this will now be: home/nvidia_gpu/{gpu_device_id}/{sensor_type}
+            # For liquidctl, it remains: home/liquidctl/{aquacomputer_quadro}/{sensor_type}/{sensor_name}
+            # str.join allocates the result in one go with a known length,
+            # unlike the chained concatenation an f-string compiles to
+            if is_gpu_device:
+                topic = '/'.join((device_prefix, sensor_type))
+            else:
+                topic = '/'.join((device_prefix, sensor_type, sensor_name))
+
+            # Skip values that have not changed since the last publish
+            if not _should_publish(topic, sensor_value, delta_tolerance):
+                continue
+
+            try:
+                if logger.isEnabledFor(logging.DEBUG):
                     unit_display = f" {sensor_unit}" if units_enabled and sensor_unit else ""
-                    logger.info(f"Publishing to {topic}: {sensor_value}{unit_display}")
-                    client.publish(topic, json.dumps(payload), qos=1)
-                except Exception as e:
-                    logger.error(f"Failed to publish sensor {sensor_name} to topic {topic}: {e}")
+                    logger.debug("Publishing to %s: %s%s", topic, sensor_value, unit_display)
+                result = _publish(client, topic, payload, qos=qos_by_category.get(sensor_type, qos), retain=retain)
+                # Record the baseline only for values that were actually
+                # handed off; failures and queue drops retry next cycle
+                if result is not None:
+                    _last_values[topic] = sensor_value
+                    msg_infos.append(result)
+            except Exception as e:
+                logger.error(f"Failed to publish sensor {sensor_name} to topic {topic}: {e}")
     else:
 
         # Fallback for unexpected data structure or direct sensor values, not typically used for current GPU data format.
@@ -279,46 +805,50 @@ def publish_device_sensors(client, device_data, device_name, timestamp, units_en
         for key, value in device_data.items():
             if key in ['device', 'description', 'bus', 'address']:
                 continue
-            publish_single_sensor(client, topic_device_id, 'general', key, value, timestamp, units_enabled, current_topic_base)
+            msg_info = publish_single_sensor(client, topic_device_id, 'general', key, value, timestamp, units_enabled, current_topic_base, qos, retain)
+            if msg_info is not None:
+                msg_infos.append(msg_info)
+    return msg_infos
 
 
+# Compiled once at import: each alternative is an order-independent lookahead,
+# tried in the same priority order as the old if/elif chain, so one C-level
+# scan replaces up to ten Python substring searches per sensor key
+_CATEGORY_RE = re.compile(
+    r'(?P<temperature>(?=.*(?:temp|°c)))|'
+    r'(?P<fan_speed>(?=.*fan)(?=.*(?:speed|rpm)))|'
+    r'(?P<fan_power>(?=.*fan)(?=.*power))|'
+    r'(?P<fan_voltage>(?=.*fan)(?=.*voltage))|'
+    r'(?P<fan_current>(?=.*fan)(?=.*current))|'
+    r'(?P<flow>(?=.*flow))|'
+    r'(?P<pump>(?=.*pump))|'
+    r'(?P<voltage>(?=.*voltage))|'
+    r'(?P<current>(?=.*current))|'
+    r'(?P<power>(?=.*power))',
+    re.S
+)
+
+
+@lru_cache(maxsize=256)
 def categorize_sensor(sensor_key):
     """
-    Categorize sensor based on its key name
-    
+    Categorize sensor based on its key name.
+
+    Memoized: the set of keys a device reports is small and repeats every
+    poll, so after the first cycle each lookup is a cache hit and the regex
+    scan (and the lower() allocation) only runs once per unique key.
+
     Args:
         sensor_key (str): The sensor key name
         
     Returns:
         str: Category for the sensor
     """
-    key_lower = sensor_key.lower()
-    
-    if 'temp' in key_lower or '°c' in key_lower:
-        return 'temperature'
-    elif 'fan' in key_lower and ('speed' in key_lower or 'rpm' in key_lower):
-        return 'fan_speed'
-    elif 'fan' in key_lower and 'power' in key_lower:
-        return 'fan_power'
-    elif 'fan' in key_lower and 'voltage' in key_lower:
-        return 'fan_voltage'
-    elif 'fan' in key_lower and 'current' in key_lower:
-        return 'fan_current'
-    elif 'flow' in key_lower:
-        return 'flow'
-    elif 'pump' in key_lower:
-        return 'pump'
-    elif 'voltage' in key_lower:
-        return 'voltage'
-    elif 'current' in key_lower:
-        return 'current'
-    elif 'power' in key_lower:
-        return 'power'
-    else:
-        return 'sensor'
+    match = _CATEGORY_RE.match(sensor_key.lower())
+    return match.lastgroup if match else 'sensor'
 
 
-def publish_single_sensor(client, device_name, sensor_type, sensor_name, sensor_value, timestamp, units_enabled, target_mqtt_topic_base):
+def publish_single_sensor(client, device_name, sensor_type, sensor_name, sensor_value, timestamp, units_enabled, target_mqtt_topic_base, qos=0, retain=False):
     """
     Publish a single sensor reading to MQTT
     
@@ -331,6 +861,11 @@ def publish_single_sensor(client, device_name, sensor_type, sensor_name, sensor_
         timestamp (str): ISO timestamp for messages
         units_enabled (bool): Whether to include units in the payload
         target_mqtt_topic_base (str): The base topic to use for MQTT messages (either liquidctl or nvidia_gpu)
+        qos (int): MQTT QoS level for the publish
+        retain (bool): Ask the broker to retain the message
+
+    Returns:
+        MQTTMessageInfo or None: Result of client.publish, None on failure
     """
     # For GPU metrics, sensor_type is already the category (e.g., 'temperature', 'power').
     # We want the topic to be: home/nvidia_gpu/{gpu_name_gpu_X}/{sensor_type}
@@ -351,39 +886,167 @@ def publish_single_sensor(client, device_name, sensor_type, sensor_name, sensor_
     # Note: This function doesn't have access to unit information from the original sensor data
     # Units are primarily handled in publish_device_sensors for the main liquidctl status format
     
+    mqtt_config = load_config()['mqtt']
+    if not _should_publish(topic, sensor_value, mqtt_config.get('delta_tolerance', 0.1)):
+        return None
+
     try:
-        logger.info(f"Publishing to {topic}: {sensor_value}")
-        client.publish(topic, json.dumps(payload), qos=1)
+        logger.debug("Publishing to %s: %s", topic, sensor_value)
+        result = _publish(client, topic, _json_dumps(payload), qos=mqtt_config.get('qos_by_category', {}).get(sensor_type, qos), retain=retain)
+        if result is not None:
+            _last_values[topic] = sensor_value
+        return result
     except Exception as e:
         logger.error(f"Failed to publish sensor {sensor_name} to topic {topic}: {e}")
+        return None
 
 
-def main():
-    """Main execution function"""
-    logger.info("Starting liquidctl2mqtt wrapper")
+# Constructor arguments resolved once at import: paho-mqtt >= 2.0 requires a
+# callback API version (VERSION2 avoids the deprecation warning), older
+# releases do not know the argument at all
+_CLIENT_KWARGS = {'client_id': 'liquidctl2mqtt', 'clean_session': False}
+if CallbackAPIVersion is not None:
+    _CLIENT_KWARGS['callback_api_version'] = CallbackAPIVersion.VERSION2
 
-    # Load configuration
-    config = load_config()
-    
-    # MQTT Configuration - prioritize environment variables over config file
-    mqtt_host = os.environ.get('MQTT_HOST', config['mqtt']['host'])
-    mqtt_port = int(os.environ.get('MQTT_PORT', config['mqtt']['port']))
-    mqtt_user = os.environ.get('MQTT_USER', config['mqtt']['username']) or None
-    mqtt_password = os.environ.get('MQTT_PASSWORD', config['mqtt']['password']) or None
-    mqtt_topic_base = os.environ.get('MQTT_TOPIC_BASE', config['mqtt']['mqtt_topic_base'])
-    nvidia_gpu_topic_base = os.environ.get('NVIDIA_GPU_TOPIC_BASE', config['mqtt']['nvidia_gpu_topic_base'])
 
-    # Units configuration - prioritize environment variable over config file
-    units_enabled = os.environ.get('LIQUIDCTL_UNITS_ENABLED', str(config['liquidctl']['units_enabled'])).lower() in ('true', '1', 'yes', 'on')
+def create_mqtt_client(client_id=None):
+    """
+    Create an MQTT client compatible with different paho-mqtt versions.
 
-    # Generate timestamp for all messages
-    timestamp = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    Uses a stable client ID and a persistent (non-clean) session so the
+    broker retains subscription/session state across reconnects.
+
+    Args:
+        client_id (str): Optional client ID override (pool members get a
+            numbered suffix so the broker sees distinct sessions)
+
+    Returns:
+        mqtt.Client: Unconnected client instance
+    """
+    kwargs = _CLIENT_KWARGS
+    if client_id is not None:
+        kwargs = dict(_CLIENT_KWARGS, client_id=client_id)
+    return mqtt.Client(**kwargs)
+
+
+# Process-wide MQTT client, built lazily and reused across poll cycles
+_mqtt_client = None
+_mqtt_client_lock = threading.Lock()
+
+# Optional client pool (mqtt.pool_size > 1): every client owns its own TCP
+# connection, and each topic always hashes to the same client so MQTT's
+# per-topic ordering guarantee is preserved
+_client_pool = []
+
+
+def get_mqtt_client():
+    """
+    Return the process-wide MQTT client, creating it on first use.
+
+    Repeat callers share one client instance, so credentials and any future
+    TLS context are only set up once per process.
+
+    Returns:
+        mqtt.Client: The shared client instance
+    """
+    global _mqtt_client
+    with _mqtt_client_lock:
+        if _mqtt_client is None:
+            _mqtt_client = create_mqtt_client()
+        return _mqtt_client
+
+
+def _route_client(default_client, topic):
+    """Pick the pool client for a topic, or the default when no pool runs."""
+    if not _client_pool:
+        return default_client
+    return _client_pool[hash(topic) % len(_client_pool)]
+
+
+def start_client_pool(primary, settings):
+    """
+    Bring up extra MQTT clients when mqtt.pool_size asks for more than one.
+
+    paho serializes all publishes on a single socket; additional clients
+    each get their own connection (and numbered client ID) so publish
+    throughput scales with the pool. The primary client keeps the
+    availability will and stays first in the pool.
+    """
+    pool_size = load_config()['mqtt'].get('pool_size', 1)
+    if pool_size <= 1:
+        return
+    _client_pool.append(primary)
+    for i in range(1, pool_size):
+        client = create_mqtt_client(client_id=f'liquidctl2mqtt-{i}')
+        if settings.mqtt_user:
+            client.username_pw_set(settings.mqtt_user, settings.mqtt_password)
+        client.reconnect_delay_set(min_delay=1, max_delay=120)
+        client.max_inflight_messages_set(100)
+        client.connect_async(settings.mqtt_host, settings.mqtt_port, 60)
+        client.loop_start()
+        _client_pool.append(client)
+    logger.info("Started MQTT client pool with %d connections", pool_size)
+
+
+def stop_client_pool():
+    """Stop and disconnect the extra pool clients (the primary is shared)."""
+    for client in _client_pool[1:]:
+        client.loop_stop()
+        client.disconnect()
+    _client_pool.clear()
+
+
+def _wait_for_connection(client, timeout=5.0):
+    """
+    Wait briefly for the background network thread to finish connecting.
+
+    Args:
+        client: MQTT client instance
+        timeout (float): Maximum seconds to wait
+
+    Returns:
+        bool: Whether the client is connected
+    """
+    deadline = time.monotonic() + timeout
+    while not client.is_connected() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return client.is_connected()
+
+
+def poll_and_publish(client, settings):
+    """
+    Run one sample cycle: gather liquidctl and GPU data and publish it.
+
+    Args:
+        client: Connected MQTT client instance
+        settings (Settings): Resolved runtime settings
+
+    Returns:
+        int: 0 on success, 1 when no data could be gathered or publishing failed
+    """
+    # Periodically drop the delta-publish baselines so every sensor gets a
+    # full republish and retained topics cannot go stale
+    global _poll_count, _last_cycle_published
+    _poll_count += 1
+    if _poll_count % KEEPALIVE_POLLS == 0:
+        _last_values.clear()
+        _meta_published.clear()
+
+    # Generate one timestamp per cycle, shared by every payload. Built from
+    # time.time_ns + strftime directly — same ISO-8601 Zulu format as the
+    # previous datetime/isoformat/replace chain without the intermediate
+    # datetime object and string rewrite
+    now_ns = time.time_ns()
+    sec, frac_ns = divmod(now_ns, 1_000_000_000)
+    timestamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec)) + f'.{frac_ns // 1_000_000:03d}Z'
+
+    # liquidctl and nvidia-smi are independent subprocess waits, so run them
+    # concurrently: the cycle costs the slower of the two instead of the sum
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        liquidctl_future = executor.submit(run_liquidctl_command)
+        gpu_future = executor.submit(get_gpu_metrics)
+        liquidctl_data = liquidctl_future.result()
 
-    liquidctl_device_name = get_device_name()
-    
-    # Run liquidctl command
-    liquidctl_data = run_liquidctl_command()
-    
     if liquidctl_data is None:
         logger.info("No data retrieved from liquidctl.")
         liquidctl_data = [] # Ensure it's an empty list if no liquidctl data
@@ -393,10 +1056,10 @@ def main():
     # Get GPU metrics
     gpu_data_list = []
     try:
-        gpu_metrics = get_gpu_metrics()
+        gpu_metrics = gpu_future.result()
         if gpu_metrics:
             for i, metrics in enumerate(gpu_metrics):
-                gpu_name_base = metrics.get('name', 'nvidia_gpu').replace(' ', '_').lower()
+                gpu_name_base = metrics.get('name', 'nvidia_gpu').translate(_TOPIC_TABLE)
                 unique_gpu_device_id = f"{gpu_name_base}_gpu_{i}"
                 
                 gpu_status_list = []
@@ -416,39 +1079,22 @@ def main():
 
     # Check if we have any data to publish
     if not liquidctl_data and not gpu_data_list:
-        logger.error("No data (liquidctl or GPU) retrieved, exiting.")
+        logger.error("No data (liquidctl or GPU) retrieved.")
         return 1
 
-    # Create MQTT client with compatibility for different paho-mqtt versions
-    client = None
     try:
-        # Try new API first (paho-mqtt >= 2.0) - use VERSION2 to avoid deprecation warning
-        client = mqtt.Client(CallbackAPIVersion.VERSION2)
-    except (AttributeError, TypeError):
-        try:
-            # Try VERSION1 if VERSION2 is not available (paho-mqtt < 2.0)
-            client = mqtt.Client(CallbackAPIVersion.VERSION1)
-        except (AttributeError, TypeError):
-            # Fall back to old API (paho-mqtt < 2.0)
-            client = mqtt.Client()
-    
-    # Set credentials if provided
-    if mqtt_user and mqtt_password:
-        client.username_pw_set(mqtt_user, mqtt_password)
-    
-    try:
-        # Connect to MQTT broker
-        logger.info(f"Connecting to MQTT broker at {mqtt_host}:{mqtt_port}")
-        client.connect(mqtt_host, mqtt_port, 60)
-        
-        # Start the loop to handle network traffic
-        client.loop_start()
-        
+        # The handshake runs on the network thread while liquidctl/nvidia-smi
+        # were being polled; it should be done by now, but cover slow links
+        if not _wait_for_connection(client):
+            logger.warning("MQTT connection not yet established, messages may be dropped")
+
+        msg_infos = []
+
         # Publish liquidctl data
         if liquidctl_data:
             logger.info("Publishing liquidctl data to MQTT")
-            publish_to_mqtt(client, liquidctl_data, liquidctl_device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base)
-        
+            msg_infos.extend(publish_to_mqtt(client, liquidctl_data, settings.device_name, timestamp, settings.units_enabled, settings.mqtt_topic_base, settings.nvidia_gpu_topic_base, settings.qos, settings.aggregate, settings.retain))
+
         # Publish GPU data
         if gpu_data_list:
             logger.info("Publishing NVIDIA GPU data to MQTT")
@@ -459,28 +1105,154 @@ def main():
             # so we'll pass the 'device' from each list item directly.
             for gpu_device_data in gpu_data_list:
                 actual_gpu_device_name = gpu_device_data.get('device', 'nvidia_gpu')
-                publish_to_mqtt(client, gpu_device_data, actual_gpu_device_name, timestamp, units_enabled, mqtt_topic_base, nvidia_gpu_topic_base)
+                msg_infos.extend(publish_to_mqtt(client, gpu_device_data, actual_gpu_device_name, timestamp, settings.units_enabled, settings.mqtt_topic_base, settings.nvidia_gpu_topic_base, settings.qos, settings.aggregate, settings.retain))
 
-        # Give time for messages to be sent before disconnecting
-        time.sleep(1)
-        
-        # Stop the loop and disconnect
-        client.loop_stop()
-        client.disconnect()
-        
-        logger.info("All relevant data successfully published to MQTT")
+        published_count = len(msg_infos)
+        _last_cycle_published = published_count
+
+        if _publish_queue is not None:
+            # Messages were handed to the publisher thread; wait for it to
+            # drain so a stalled broker shows up here, not as silent loss
+            _publish_queue.join()
+        else:
+            # Wait until every queued message has actually left the socket
+            # instead of sleeping for a fixed second. QoS 0 delivery is
+            # in-order on a single socket, so confirming the last message
+            # covers them all — but only when one client is in play; with a
+            # pool the infos span several sockets, so wait on each
+            if settings.qos == 0 and not _client_pool:
+                msg_infos = msg_infos[-1:]
+            for msg_info in msg_infos:
+                try:
+                    msg_info.wait_for_publish(timeout=5)
+                except (ValueError, RuntimeError) as e:
+                    logger.warning(f"Could not confirm publish of message {msg_info.mid}: {e}")
+
+        logger.info("Published %d messages to MQTT this cycle", published_count)
         return 0
-        
+
     except Exception as e:
         logger.error(f"Failed to publish to MQTT: {e}")
-        if client:
-            try:
-                client.loop_stop()
-                client.disconnect()
-            except:
-                pass
         return 1
 
 
+# Event set by SIGTERM/SIGINT to request a clean shutdown of the poll loop
+_shutdown = threading.Event()
+
+
+def _handle_shutdown_signal(signum, frame):
+    """Signal handler that requests a clean shutdown of the daemon loop."""
+    logger.info(f"Received signal {signum}, shutting down")
+    _shutdown.set()
+
+
+def _parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Publish liquidctl and NVIDIA GPU sensor data to an MQTT broker')
+    parser.add_argument('--once', action='store_true',
+                        help='run a single sample cycle and exit (cron/timer friendly)')
+    parser.add_argument('--interval', type=float, default=None,
+                        help='seconds between sample cycles (overrides config and environment)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Main execution function.
+
+    Connects to the MQTT broker once and keeps publishing sensor data every
+    `interval` seconds until terminated, so the TCP/MQTT handshake is paid
+    once per process instead of once per sample. With --once a single cycle
+    is published and the process exits, for callers that still schedule via
+    cron or a systemd timer.
+    """
+    args = _parse_args(argv)
+
+    logger.info("Starting liquidctl2mqtt wrapper")
+
+    # Resolve configuration + environment once for the whole process
+    settings = Settings.from_config(load_config())
+
+    client = get_mqtt_client()
+
+    # Set credentials if provided
+    if settings.mqtt_user and settings.mqtt_password:
+        client.username_pw_set(settings.mqtt_user, settings.mqtt_password)
+
+    # Availability topic: the broker publishes "offline" for us if the
+    # process dies, and "online" is (re)asserted on every (re)connect
+    availability_topic = f"{settings.mqtt_topic_base}/{settings.device_name}/availability"
+    client.will_set(availability_topic, "offline", retain=True)
+
+    def _announce_online(client, userdata, flags, *args):
+        # Small telemetry packets should not sit in Nagle's buffer waiting
+        # for a coalescing timer; set NODELAY on each (re)connected socket
+        try:
+            client.socket().setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError):
+            pass
+        client.publish(availability_topic, "online", retain=True)
+
+    client.on_connect = _announce_online
+
+    signal.signal(signal.SIGTERM, _handle_shutdown_signal)
+    signal.signal(signal.SIGINT, _handle_shutdown_signal)
+
+    try:
+        # Start the connection asynchronously: the network thread performs
+        # the TCP/MQTT handshake while the first sensor poll is already
+        # running, and also handles reconnects if the broker goes away
+        logger.info(f"Connecting to MQTT broker at {settings.mqtt_host}:{settings.mqtt_port}")
+        client.reconnect_delay_set(min_delay=1, max_delay=120)
+        # Let up to 100 QoS>0 publishes be in flight at once instead of
+        # serializing on each PUBACK (paho's default is 20)
+        client.max_inflight_messages_set(100)
+        client.connect_async(settings.mqtt_host, settings.mqtt_port, 60)
+        client.loop_start()
+        start_client_pool(client, settings)
+        # Decouple sensor collection from broker backpressure: publishes go
+        # through a bounded queue drained by this thread
+        start_publisher_thread(client)
+    except Exception as e:
+        logger.error(f"Failed to start MQTT connection: {e}")
+        return 1
+
+    interval = args.interval if args.interval is not None else settings.interval
+    sleep_seconds = interval
+    idle_polls = 0
+
+    rc = 0
+    try:
+        while not _shutdown.is_set():
+            rc = poll_and_publish(client, settings)
+            if args.once:
+                break
+            # Stepped backoff: when delta suppression leaves nothing to
+            # publish for several cycles in a row the readings are steady,
+            # so stretch the sleep (up to 8x); any activity snaps it back
+            if _last_cycle_published == 0:
+                idle_polls += 1
+                if idle_polls >= 4:
+                    sleep_seconds = min(sleep_seconds * 2, interval * 8)
+            else:
+                idle_polls = 0
+                sleep_seconds = interval
+            # Sleep until the next cycle, waking immediately on shutdown
+            _shutdown.wait(sleep_seconds)
+    finally:
+        if _publish_queue is not None:
+            # The sentinel makes the publisher thread confirm its tail;
+            # join so that happens before the connections are torn down
+            _publish_queue.put(None)
+            _publish_queue.join()
+        stop_client_pool()
+        client.loop_stop()
+        client.disconnect()
+        logger.info("Disconnected from MQTT broker")
+
+    return rc
+
+
 if __name__ == "__main__":
     sys.exit(main())
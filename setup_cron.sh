@@ -8,7 +8,7 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 echo "Setting up liquidctl2mqtt cronjob to run every minute..."
 
 # Add to crontab using crontab -l and pipe to crontab
-(crontab -l 2>/dev/null; echo "* * * * * $SCRIPT_DIR/liquidctl_mqtt_wrapper.py") | crontab -
+(crontab -l 2>/dev/null; echo "* * * * * $SCRIPT_DIR/liquidctl_mqtt_wrapper.py --once") | crontab -
 
 echo "Cronjob setup complete!"
 echo "To verify: crontab -l"